@@ -5,8 +5,11 @@ This module loads and validates agent and team configurations from YAML files.
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
+import pickle
+import tempfile
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +17,25 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Default model providers in priority order:
+# (API key variable, provider, model variable, default model)
+_MODEL_PROVIDERS = (
+    ("MISTRAL_API_KEY", "mistral", "MISTRAL_MODEL", "mistral-large-2512"),
+    ("XAI_API_KEY", "xai", "XAI_MODEL", "grok-4-1-fast-reasoning"),
+    ("OPENAI_API_KEY", "openai", "OPENAI_MODEL", "gpt-4o-mini"),
+)
+
+# Bumped whenever AgentHubConfig's pickled layout changes, to invalidate
+# on-disk caches written by older versions (caches written before this
+# existed have a "mtime:size" key and never match)
+_CONFIG_CACHE_FORMAT = 2
+
+# Parsed configurations keyed by (resolved path, mtime_ns)
+_CONFIG_CACHE: dict[tuple[str, int], AgentHubConfig] = {}
+
 
 class ConfigError(Exception):
     """Raised when configuration is invalid."""
@@ -23,6 +45,16 @@ class ConfigError(Exception):
 class AgentHubConfig:
     """Container for agent hub configuration."""
 
+    __slots__ = (
+        "agents",
+        "teams",
+        "_agent_names",
+        "_teams_by_name",
+        "_agents_by_name",
+        "_mcp_eligible",
+        "_mcp_servers",
+    )
+
     def __init__(
         self,
         agents: list[dict[str, Any]],
@@ -44,36 +76,26 @@ class AgentHubConfig:
         if not self.agents and not self.teams:
             raise ConfigError("At least one agent or team must be defined")
 
+        # Derived indices, all filled in a single pass over agents and teams
+        self._agent_names: set[str] = set()
+        self._agents_by_name: dict[str, dict[str, Any]] = {}
+        self._mcp_eligible: list[dict[str, Any]] = []
+        self._teams_by_name: dict[str, dict[str, Any]] = {}
+        self._mcp_servers: dict[str, dict[str, Any]] | None = None
+
         # Validate agents
-        agent_names = set()
         for agent in self.agents:
             if "name" not in agent:
                 raise ConfigError("All agents must have a 'name' field")
             
             name = agent["name"]
-            if name in agent_names:
+            if name in self._agent_names:
                 raise ConfigError(f"Duplicate agent name: {name}")
-            agent_names.add(name)
+            self._agent_names.add(name)
+            self._agents_by_name[name] = agent
 
             # Validate plugin configuration
             if "plugin_type" in agent:
-                plugin_type = agent["plugin_type"]
-                
-                # Import here to avoid circular dependency
-                from .plugin_loader import PluginRegistry
-                
-                # Discover available plugins for validation
-                PluginRegistry.discover_plugins()
-                available_plugins = PluginRegistry.list_available_plugins()
-                
-                if plugin_type not in available_plugins:
-                    available_str = ", ".join(f"'{p}'" for p in sorted(available_plugins))
-                    raise ConfigError(
-                        f"Invalid plugin_type '{plugin_type}' for agent '{name}'. "
-                        f"Available plugins: {available_str or 'none'}. "
-                        f"Run 'python -m egile_agent_hub.plugin_loader' to see installed plugins."
-                    )
-                
                 # For stdio transport, mcp_command is required instead of mcp_port
                 transport = agent.get("mcp_transport", "stdio")
                 if transport == "sse" and "mcp_port" not in agent:
@@ -84,26 +106,64 @@ class AgentHubConfig:
                     # mcp_command is optional - has defaults in plugin_loader
                     pass
 
+                if "mcp_port" in agent:
+                    self._mcp_eligible.append(agent)
+
         # Validate teams
-        team_names = set()
         for team in self.teams:
             if "name" not in team:
                 raise ConfigError("All teams must have a 'name' field")
             
             name = team["name"]
-            if name in team_names:
+            if name in self._teams_by_name:
                 raise ConfigError(f"Duplicate team name: {name}")
-            team_names.add(name)
+            self._teams_by_name[name] = team
 
             if "members" not in team or not team["members"]:
                 raise ConfigError(f"Team '{name}' must have at least one member")
 
             # Verify all team members exist as agents
-            for member in team["members"]:
-                if member not in agent_names:
-                    raise ConfigError(
-                        f"Team '{name}' references unknown agent: {member}"
-                    )
+            missing = set(team["members"]) - self._agent_names
+            if missing:
+                raise ConfigError(
+                    f"Team '{name}' references unknown agent: {', '.join(sorted(missing))}"
+                )
+
+        self._validate_plugins()
+
+    def _validate_plugins(self) -> None:
+        """
+        Check that every agent's plugin_type is installed.
+
+        Also run for configurations read from the on-disk cache, since plugins
+        may have been uninstalled after the cache was written.
+
+        Raises:
+            ConfigError: If an agent references an unavailable plugin
+        """
+        needed = {agent["plugin_type"] for agent in self.agents if "plugin_type" in agent}
+        if not needed:
+            return
+
+        # Import here to avoid circular dependency
+        from .plugin_loader import PluginRegistry
+
+        # Resolve only the plugin types in use; the full scan is only needed
+        # to list the installed plugins in the error message
+        PluginRegistry.discover_selective(needed)
+        for agent in self.agents:
+            if "plugin_type" not in agent:
+                continue
+            plugin_type = agent["plugin_type"]
+
+            if not PluginRegistry.is_available(plugin_type):
+                available_plugins = PluginRegistry.list_available_plugins()
+                available_str = ", ".join(f"'{p}'" for p in sorted(available_plugins))
+                raise ConfigError(
+                    f"Invalid plugin_type '{plugin_type}' for agent '{agent['name']}'. "
+                    f"Available plugins: {available_str or 'none'}. "
+                    f"Run 'python -m egile_agent_hub.plugin_loader' to see installed plugins."
+                )
 
     def get_agents_by_team(self, team_name: str) -> list[dict[str, Any]]:
         """
@@ -115,36 +175,96 @@ class AgentHubConfig:
         Returns:
             List of agent configurations for the team
         """
-        # Find team definition
-        team = None
-        for t in self.teams:
-            if t["name"] == team_name:
-                team = t
-                break
-
-        if not team:
+        team = self._teams_by_name.get(team_name)
+        if team is None:
             return []
 
-        # Get member agents
-        member_names = team["members"]
-        return [agent for agent in self.agents if agent["name"] in member_names]
+        # Get member agents, once each even if a member is listed twice
+        agents_by_name = self._agents_by_name
+        return [
+            agents_by_name[m] for m in dict.fromkeys(team["members"]) if m in agents_by_name
+        ]
 
     def get_mcp_servers(self) -> dict[str, dict[str, Any]]:
         """
         Get all MCP server configurations.
 
+        The result is computed once and shared between calls; do not mutate it.
+
         Returns:
             Dictionary mapping agent name to MCP server config
         """
-        mcp_servers = {}
-        for agent in self.agents:
-            if "plugin_type" in agent and "mcp_port" in agent:
-                mcp_servers[agent["name"]] = {
+        if self._mcp_servers is None:
+            self._mcp_servers = {
+                agent["name"]: {
                     "plugin_type": agent["plugin_type"],
                     "port": agent["mcp_port"],
                     "host": agent.get("mcp_host", "localhost"),
                 }
-        return mcp_servers
+                for agent in self._mcp_eligible
+            }
+        return self._mcp_servers
+
+
+def _read_config_cache(cache_path: Path, cache_key: str) -> AgentHubConfig | None:
+    """
+    Read a previously pickled configuration if it matches the cache key.
+
+    Args:
+        cache_path: Path to the cache file
+        cache_key: Expected key derived from the config file's mtime and size
+
+    Returns:
+        Cached AgentHubConfig instance, or None if missing or stale
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            key, config = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug("Ignoring unreadable config cache %s: %s", cache_path, e)
+        return None
+
+    if key != cache_key or not isinstance(config, AgentHubConfig):
+        return None
+    return config
+
+
+def _write_config_cache(cache_path: Path, cache_key: str, config: AgentHubConfig) -> None:
+    """
+    Atomically write the parsed configuration to the cache file.
+
+    Args:
+        cache_path: Path to the cache file
+        cache_key: Key derived from the config file's mtime and size
+        config: Validated configuration to cache
+    """
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((cache_key, config), f, protocol=5)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except Exception as e:
+        logger.debug("Could not write config cache %s: %s", cache_path, e)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_config_path() -> Path:
+    """
+    Resolve the default configuration path once per process.
+
+    Resolved on first use rather than at import so that AGENTS_CONFIG_FILE
+    set in .env (loaded after this module is imported) is honored.
+
+    Returns:
+        Path from AGENTS_CONFIG_FILE, or agents.yaml
+    """
+    return Path(os.getenv("AGENTS_CONFIG_FILE", "agents.yaml"))
 
 
 def load_config(config_file: str | Path | None = None) -> AgentHubConfig:
@@ -155,6 +275,14 @@ def load_config(config_file: str | Path | None = None) -> AgentHubConfig:
         config_file: Path to YAML configuration file.
                     If None, tries AGENTS_CONFIG_FILE env var, then agents.yaml
 
+    When the AGENTS_CONFIG_CACHE env var is set to "1", the validated
+    configuration is pickled next to the YAML file (``<file>.cache``) and
+    reused until the YAML file's mtime or size changes. Plugin availability
+    is still checked on every cache hit.
+
+    Results are also memoized in-process per resolved path and mtime; call
+    ``load_config.cache_clear()`` to drop them.
+
     Returns:
         Validated AgentHubConfig instance
 
@@ -162,10 +290,7 @@ def load_config(config_file: str | Path | None = None) -> AgentHubConfig:
         ConfigError: If configuration is invalid or file not found
     """
     # Determine config file path
-    if config_file is None:
-        config_file = os.getenv("AGENTS_CONFIG_FILE", "agents.yaml")
-    
-    config_path = Path(config_file)
+    config_path = _default_config_path() if config_file is None else Path(config_file)
     
     if not config_path.exists():
         raise ConfigError(
@@ -173,10 +298,26 @@ def load_config(config_file: str | Path | None = None) -> AgentHubConfig:
             f"Create {config_path} based on agents.yaml.example"
         )
 
+    stat = config_path.stat()
+    memo_key = (str(config_path.resolve()), stat.st_mtime_ns)
+    if memo_key in _CONFIG_CACHE:
+        return _CONFIG_CACHE[memo_key]
+
+    # Reuse the pickled configuration if the YAML file is unchanged
+    use_cache = os.getenv("AGENTS_CONFIG_CACHE") == "1"
+    if use_cache:
+        cache_key = f"{_CONFIG_CACHE_FORMAT}:{stat.st_mtime_ns}:{stat.st_size}"
+        cache_path = config_path.with_suffix(config_path.suffix + ".cache")
+        cached = _read_config_cache(cache_path, cache_key)
+        if cached is not None:
+            cached._validate_plugins()
+            logger.info("Loaded configuration from cache %s", cache_path)
+            _CONFIG_CACHE[memo_key] = cached
+            return cached
+
     # Load YAML
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = yaml.load(config_path.read_bytes(), Loader=_SafeLoader)
     except yaml.YAMLError as e:
         raise ConfigError(f"Invalid YAML in {config_path}: {e}")
     except Exception as e:
@@ -194,10 +335,24 @@ def load_config(config_file: str | Path | None = None) -> AgentHubConfig:
     if not isinstance(teams, list):
         raise ConfigError("'teams' must be a list")
 
-    logger.info(f"Loaded configuration from {config_path}")
-    logger.info(f"Found {len(agents)} agent(s) and {len(teams)} team(s)")
+    logger.info("Loaded configuration from %s", config_path)
+    logger.info("Found %s agent(s) and %s team(s)", len(agents), len(teams))
 
-    return AgentHubConfig(agents=agents, teams=teams)
+    config = AgentHubConfig(agents=agents, teams=teams)
+    if use_cache:
+        _write_config_cache(cache_path, cache_key, config)
+
+    _CONFIG_CACHE[memo_key] = config
+    return config
+
+
+def _clear_config_cache() -> None:
+    """Drop memoized configurations and the resolved default config path."""
+    _CONFIG_CACHE.clear()
+    _default_config_path.cache_clear()
+
+
+load_config.cache_clear = _clear_config_cache  # type: ignore[attr-defined]
 
 
 def get_default_model_config() -> dict[str, str]:
@@ -211,23 +366,15 @@ def get_default_model_config() -> dict[str, str]:
         ConfigError: If no model API key is configured
     """
     # Priority: Mistral > XAI > OpenAI
-    if os.getenv("MISTRAL_API_KEY"):
-        return {
-            "provider": "mistral",
-            "model": os.getenv("MISTRAL_MODEL", "mistral-large-2512"),
-        }
-    elif os.getenv("XAI_API_KEY"):
-        return {
-            "provider": "xai",
-            "model": os.getenv("XAI_MODEL", "grok-4-1-fast-reasoning"),
-        }
-    elif os.getenv("OPENAI_API_KEY"):
-        return {
-            "provider": "openai",
-            "model": os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-        }
-    else:
-        raise ConfigError(
-            "No AI model API key configured. "
-            "Set one of: MISTRAL_API_KEY, XAI_API_KEY, or OPENAI_API_KEY"
-        )
+    environ = os.environ
+    for key_var, provider, model_var, default_model in _MODEL_PROVIDERS:
+        if environ.get(key_var):
+            return {
+                "provider": provider,
+                "model": environ.get(model_var, default_model),
+            }
+
+    raise ConfigError(
+        "No AI model API key configured. "
+        "Set one of: MISTRAL_API_KEY, XAI_API_KEY, or OPENAI_API_KEY"
+    )
@@ -6,14 +6,183 @@ Automatically discovers installed egile plugins and loads only those that are ne
 
 from __future__ import annotations
 
+import functools
 import importlib
 import importlib.metadata
+import importlib.util
 import logging
 import os
-from typing import Any
+import sys
+from collections.abc import Callable
+from typing import Any, Protocol
 
 logger = logging.getLogger(__name__)
 
+# Accepted spellings of the X/Twitter plugin type
+_XTWITTER_ALIASES = frozenset({"xtwitter", "x-twitter", "x_twitter"})
+
+# Default MCP server command per plugin type
+_DEFAULT_COMMANDS: dict[str, str] = {
+    "prospectfinder": "python -m egile_mcp_prospectfinder.server",
+    **dict.fromkeys(_XTWITTER_ALIASES, "python -m egile_mcp_x_post_creator.server"),
+}
+
+# Environment variable and fallback for the default MCP port per plugin type
+_DEFAULT_PORTS: dict[str, tuple[str, str]] = {
+    "prospectfinder": ("PROSPECTFINDER_MCP_PORT", "8001"),
+    **dict.fromkeys(_XTWITTER_ALIASES, ("XTWITTER_MCP_PORT", "8002")),
+}
+
+# Egile packages that are not agent plugins
+_EXCLUDED_PACKAGES = frozenset(
+    {"egile-agent-core", "egile_agent_core", "egile-agent-hub", "egile_agent_hub"}
+)
+
+# Name prefixes of egile agent plugin packages
+_PLUGIN_PREFIXES = ("egile-agent-", "egile_agent_")
+_PLUGIN_PREFIX_LEN = len("egile-agent-")  # Both prefixes have the same length
+
+# Translation table from distribution names to import names
+_HYPHEN_TO_UNDER = str.maketrans("-", "_")
+
+# Sentinel for single-lookup getattr probes
+_MISSING = object()
+
+# Plugin capability flags, see plugin_capabilities()
+HAS_TOOLS = 1
+HAS_START = 2
+
+
+@functools.lru_cache(maxsize=None)
+def _env_default(name: str, default: str) -> str:
+    """
+    Read an environment variable once and memoize it.
+
+    The first lookup happens lazily so values loaded from .env at startup are
+    honored; changes to the variable after that are not picked up.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset
+
+    Returns:
+        Environment value or default
+    """
+    return os.getenv(name, default)
+
+
+# Entry point group plugins can use to declare their MCP server module
+MCP_MODULES_ENTRY_POINT_GROUP = "egile_agent_hub.mcp_modules"
+
+
+@functools.lru_cache(maxsize=1)
+def _mcp_modules_from_entry_points() -> dict[str, str]:
+    """
+    Read MCP server modules declared by installed plugins, once per process.
+
+    Entry point values must be plain module paths, since the module is run
+    with ``python -m``; values with an attribute part are ignored.
+
+    Returns:
+        Dictionary mapping plugin type to MCP server module path
+    """
+    try:
+        entry_points = importlib.metadata.entry_points(group=MCP_MODULES_ENTRY_POINT_GROUP)
+    except Exception as e:
+        logger.debug("Could not read %s entry points: %s", MCP_MODULES_ENTRY_POINT_GROUP, e)
+        return {}
+
+    modules: dict[str, str] = {}
+    for ep in entry_points:
+        if ep.attr:
+            logger.warning(
+                "Ignoring %s entry point '%s': expected a module path, got '%s'",
+                MCP_MODULES_ENTRY_POINT_GROUP,
+                ep.name,
+                ep.value,
+            )
+            continue
+        modules[ep.name] = ep.module
+    return modules
+
+
+def _find_egile_package_names() -> list[str]:
+    """
+    Find installed egile distributions by their metadata directory names.
+
+    For plain directories on sys.path, only metadata directories named like
+    ``egile_agent_*.dist-info`` are opened, which avoids parsing the metadata
+    of every installed distribution. Zip files and eggs on sys.path are
+    searched with importlib.metadata instead. Distributions exposed only by
+    custom ``sys.meta_path`` finders are not found.
+
+    Returns:
+        Distribution names, in sys.path order without duplicates
+    """
+    names: list[str] = []
+    seen: set[str] = set()
+    for entry in sys.path:
+        paths: list[str] | None = None
+        if not entry.endswith(".egg"):
+            try:
+                with os.scandir(entry or ".") as it:
+                    paths = sorted(
+                        item.path
+                        for item in it
+                        if item.name.startswith(_PLUGIN_PREFIXES)
+                        and item.name.endswith((".dist-info", ".egg-info"))
+                    )
+            except NotADirectoryError:
+                pass
+            except OSError:
+                continue
+
+        if paths is None:
+            dists = importlib.metadata.distributions(path=[entry])
+        else:
+            dists = map(importlib.metadata.Distribution.at, paths)
+
+        for dist in dists:
+            try:
+                name = dist.metadata.get("Name", "")
+            except Exception as e:
+                logger.debug("Could not read distribution metadata in %s: %s", entry, e)
+                continue
+            if name and name not in seen:
+                seen.add(name)
+                names.append(name)
+    return names
+
+
+class ToolProvider(Protocol):
+    """Plugin that exposes tool functions to its agent."""
+
+    def get_tool_functions(self) -> dict[str, Callable[..., Any]]: ...
+
+
+class AgentStartHook(Protocol):
+    """Plugin that needs initialization when its agent starts."""
+
+    async def on_agent_start(self, agent: Any) -> None: ...
+
+
+def plugin_capabilities(plugin: Any) -> int:
+    """
+    Probe which optional plugin hooks a plugin implements.
+
+    Args:
+        plugin: Plugin instance
+
+    Returns:
+        Bitmask of HAS_TOOLS (ToolProvider) and HAS_START (AgentStartHook)
+    """
+    caps = 0
+    if callable(getattr(plugin, "get_tool_functions", None)):
+        caps |= HAS_TOOLS
+    if callable(getattr(plugin, "on_agent_start", None)):
+        caps |= HAS_START
+    return caps
+
 
 class PluginLoadError(Exception):
     """Raised when a plugin cannot be loaded."""
@@ -25,6 +194,7 @@ class PluginRegistry:
 
     _available_plugins: dict[str, str] = {}  # Maps plugin_type -> package_name
     _loaded_plugins: dict[str, type] = {}  # Maps plugin_type -> plugin class
+    _class_name_candidates: dict[str, tuple[str, ...]] = {}  # Maps plugin_type -> class names
     _discovered: bool = False
 
     @classmethod
@@ -35,33 +205,81 @@ class PluginRegistry:
 
         logger.info("Discovering installed egile plugins...")
         
-        # Packages to exclude (not actual agent plugins)
-        excluded_packages = {"egile-agent-core", "egile_agent_core", "egile-agent-hub", "egile_agent_hub"}
-        
         # Find all installed packages that match egile agent patterns
-        for dist in importlib.metadata.distributions():
-            package_name = dist.metadata.get("Name", "")
-            
+        for package_name in _find_egile_package_names():
             # Check if it's an egile agent plugin package
-            if package_name.startswith("egile-agent-") or package_name.startswith("egile_agent_"):
+            if package_name.startswith(_PLUGIN_PREFIXES):
                 # Skip non-plugin packages
-                if package_name in excluded_packages:
+                if package_name in _EXCLUDED_PACKAGES:
                     continue
                 
                 # Convert package name to plugin type (e.g., "egile-agent-prospectfinder" -> "prospectfinder")
-                plugin_type = package_name.replace("egile-agent-", "").replace("egile_agent_", "")
+                plugin_type = package_name[_PLUGIN_PREFIX_LEN:]
                 
                 # Keep hyphens for consistency with YAML naming conventions (e.g., "x-twitter")
                 # No normalization needed - preserve the original format
                 
                 # Convert to import name (hyphens to underscores)
-                import_name = package_name.replace("-", "_")
+                import_name = package_name.translate(_HYPHEN_TO_UNDER)
                 
                 cls._available_plugins[plugin_type] = import_name
-                logger.info(f"Discovered plugin: {plugin_type} (package: {package_name})")
+                logger.info("Discovered plugin: %s (package: %s)", plugin_type, package_name)
         
         cls._discovered = True
-        logger.info(f"Plugin discovery complete. Found {len(cls._available_plugins)} plugin(s)")
+        logger.info("Plugin discovery complete. Found %s plugin(s)", len(cls._available_plugins))
+
+    @classmethod
+    def discover_selective(cls, needed: set[str]) -> None:
+        """
+        Resolve only the given plugin types, skipping the full distribution scan.
+
+        Each plugin type is looked up directly as an ``egile_agent_<type>``
+        package. If any of them cannot be found that way, falls back to
+        full discovery.
+
+        Args:
+            needed: Plugin types referenced by the configuration
+        """
+        if cls._discovered:
+            return
+
+        resolved = {}
+        for plugin_type in needed:
+            if plugin_type in cls._available_plugins:
+                continue
+
+            import_name = f"egile_agent_{plugin_type.translate(_HYPHEN_TO_UNDER)}"
+            try:
+                spec = importlib.util.find_spec(import_name)
+            except (ImportError, ValueError):
+                spec = None
+
+            if spec is None or import_name in _EXCLUDED_PACKAGES:
+                logger.info("Plugin '%s' not found directly, running full discovery", plugin_type)
+                cls.discover_plugins()
+                return
+
+            resolved[plugin_type] = import_name
+
+        for plugin_type, import_name in resolved.items():
+            cls._available_plugins[plugin_type] = import_name
+            logger.info("Resolved plugin: %s (package: %s)", plugin_type, import_name)
+
+    @classmethod
+    def is_available(cls, plugin_type: str) -> bool:
+        """
+        Check whether a plugin type has been discovered or resolved.
+
+        Does not trigger discovery; call discover_selective() or
+        discover_plugins() first.
+
+        Args:
+            plugin_type: Type of plugin
+
+        Returns:
+            True if the plugin type can be loaded
+        """
+        return plugin_type in cls._available_plugins
 
     @classmethod
     def list_available_plugins(cls) -> list[str]:
@@ -80,6 +298,10 @@ class PluginRegistry:
     def get_mcp_server_module(cls, plugin_type: str) -> str | None:
         """
         Get the MCP server module name for a plugin type.
+
+        Modules declared in the ``egile_agent_hub.mcp_modules`` entry point
+        group are used without importing the plugin; otherwise the plugin
+        class's ``mcp_server_module`` property is consulted.
         
         Args:
             plugin_type: Type of plugin
@@ -87,18 +309,19 @@ class PluginRegistry:
         Returns:
             MCP server module path or None if not available
         """
+        module = _mcp_modules_from_entry_points().get(plugin_type)
+        if module:
+            return module
+
         try:
             plugin_class = cls._load_plugin_class(plugin_type)
             # Create a temporary instance to check for mcp_server_module property
             # Most plugins have __init__ that can be called without args or with defaults
-            if hasattr(plugin_class, 'mcp_server_module'):
+            module = getattr(plugin_class, "mcp_server_module", _MISSING)
+            if module is not _MISSING:
                 # Try to access as class property first
-                try:
-                    module = plugin_class.mcp_server_module
-                    if module and not callable(module):
-                        return module
-                except (AttributeError, TypeError):
-                    pass
+                if module and not callable(module):
+                    return module
                 
                 # Try creating instance with default args
                 try:
@@ -109,7 +332,7 @@ class PluginRegistry:
             
             return None
         except Exception as e:
-            logger.debug(f"Could not get MCP server module for {plugin_type}: {e}")
+            logger.debug("Could not get MCP server module for %s: %s", plugin_type, e)
             return None
 
     @classmethod
@@ -129,8 +352,12 @@ class PluginRegistry:
         if plugin_type in cls._loaded_plugins:
             return cls._loaded_plugins[plugin_type]
         
-        if not cls._discovered:
-            cls.discover_plugins()
+        # Discovery is lazy: resolve this plugin type on first use, falling
+        # back to a full scan only if it cannot be found directly
+        if plugin_type not in cls._available_plugins and not cls._discovered:
+            cls.discover_selective({plugin_type})
+            available = ", ".join(cls._available_plugins) or "none"
+            logger.info("Available plugins: %s", available)
         
         if plugin_type not in cls._available_plugins:
             available = ", ".join(cls._available_plugins.keys()) or "none"
@@ -146,39 +373,20 @@ class PluginRegistry:
             # and named like ProspectFinderPlugin, XTwitterPlugin, etc.
             module = importlib.import_module(package_name)
             
-            # Try common naming conventions for plugin classes
-            # Handle both hyphenated (x-twitter) and single-word (prospectfinder) plugin types
-            
-            # Normalize to underscore-separated for consistent word splitting
-            normalized = plugin_type.replace("-", "_")
-            
             # Try to get the class name from __all__ first
             plugin_class = None
-            if hasattr(module, "__all__"):
-                for name in module.__all__:
-                    if name.endswith("Plugin"):
-                        plugin_class = getattr(module, name)
-                        break
+            for name in getattr(module, "__all__", ()):
+                if name.endswith("Plugin"):
+                    plugin_class = getattr(module, name)
+                    break
             
             # If not found in __all__, try common naming patterns
             if plugin_class is None:
-                possible_class_names = [
-                    # Standard CamelCase: ProspectFinderPlugin, XTwitterPlugin
-                    "".join(word.capitalize() for word in normalized.split("_")) + "Plugin",
-                ]
-                
-                # For hyphenated types, also try without separator: XtwitterPlugin
-                if "-" in plugin_type:
-                    possible_class_names.append(
-                        plugin_type.replace("-", "").capitalize() + "Plugin"
-                    )
-                
-                # Add generic fallback
-                possible_class_names.append("Plugin")
-                
+                possible_class_names = cls._get_class_name_candidates(plugin_type)
                 for class_name in possible_class_names:
-                    if hasattr(module, class_name):
-                        plugin_class = getattr(module, class_name)
+                    candidate = getattr(module, class_name, _MISSING)
+                    if candidate is not _MISSING:
+                        plugin_class = candidate
                         break
             
             if plugin_class is None:
@@ -188,7 +396,7 @@ class PluginRegistry:
                 )
             
             cls._loaded_plugins[plugin_type] = plugin_class
-            logger.info(f"Loaded plugin class {plugin_class.__name__} from {package_name}")
+            logger.info("Loaded plugin class %s from %s", plugin_class.__name__, package_name)
             return plugin_class
             
         except ImportError as e:
@@ -200,6 +408,41 @@ class PluginRegistry:
                 f"Failed to load plugin class for '{plugin_type}': {e}"
             )
 
+    @classmethod
+    def _get_class_name_candidates(cls, plugin_type: str) -> tuple[str, ...]:
+        """
+        Get the plugin class names to try for a plugin type, computed once per type.
+
+        Args:
+            plugin_type: Type of plugin
+
+        Returns:
+            Candidate class names in lookup order
+        """
+        candidates = cls._class_name_candidates.get(plugin_type)
+        if candidates is not None:
+            return candidates
+
+        # Try common naming conventions for plugin classes
+        # Handle both hyphenated (x-twitter) and single-word (prospectfinder) plugin types
+
+        # Normalize to underscore-separated for consistent word splitting
+        normalized = plugin_type.replace("-", "_")
+        names = [
+            # Standard CamelCase: ProspectFinderPlugin, XTwitterPlugin
+            "".join(word.capitalize() for word in normalized.split("_")) + "Plugin",
+        ]
+
+        # For hyphenated types, also try without separator: XtwitterPlugin
+        if "-" in plugin_type:
+            names.append(plugin_type.replace("-", "").capitalize() + "Plugin")
+
+        # Add generic fallback
+        names.append("Plugin")
+
+        candidates = cls._class_name_candidates[plugin_type] = tuple(names)
+        return candidates
+
     @classmethod
     def get_plugin_class(cls, plugin_type: str) -> type:
         """
@@ -237,7 +480,7 @@ class PluginRegistry:
         plugin_config = cls._get_plugin_config(plugin_type, config)
 
         try:
-            logger.info(f"Creating {plugin_type} plugin with config: {plugin_config}")
+            logger.info("Creating %s plugin with config: %s", plugin_type, plugin_config)
             return plugin_class(**plugin_config)
         except Exception as e:
             raise PluginLoadError(
@@ -256,28 +499,23 @@ class PluginRegistry:
         Returns:
             Plugin-specific configuration dictionary
         """
+        g = agent_config.get
+
         # Common parameters
         plugin_config = {
-            "mcp_transport": agent_config.get("mcp_transport", "stdio"),
-            "mcp_command": agent_config.get("mcp_command"),
-            "mcp_host": agent_config.get("mcp_host", os.getenv("MCP_HOST", "localhost")),
-            "mcp_port": agent_config.get("mcp_port"),
-            "timeout": agent_config.get("timeout", 120.0),
-            "use_mcp": agent_config.get("use_mcp", False),  # Default to direct mode for Windows compatibility
+            "mcp_transport": g("mcp_transport", "stdio"),
+            "mcp_command": g("mcp_command"),
+            "mcp_host": g("mcp_host", _env_default("MCP_HOST", "localhost")),
+            "mcp_port": g("mcp_port"),
+            "timeout": g("timeout", 120.0),
+            "use_mcp": g("use_mcp", False),  # Default to direct mode for Windows compatibility
         }
 
         # Plugin-specific defaults
-        if plugin_type == "prospectfinder":
-            if not plugin_config["mcp_command"]:
-                plugin_config["mcp_command"] = "python -m egile_mcp_prospectfinder.server"
-            if not plugin_config["mcp_port"]:
-                plugin_config["mcp_port"] = int(os.getenv("PROSPECTFINDER_MCP_PORT", "8001"))
-
-        elif plugin_type in ("xtwitter", "x-twitter", "x_twitter"):
-            if not plugin_config["mcp_command"]:
-                plugin_config["mcp_command"] = "python -m egile_mcp_x_post_creator.server"
-            if not plugin_config["mcp_port"]:
-                plugin_config["mcp_port"] = int(os.getenv("XTWITTER_MCP_PORT", "8002"))
+        if not plugin_config["mcp_command"] and plugin_type in _DEFAULT_COMMANDS:
+            plugin_config["mcp_command"] = _DEFAULT_COMMANDS[plugin_type]
+        if not plugin_config["mcp_port"] and plugin_type in _DEFAULT_PORTS:
+            plugin_config["mcp_port"] = int(_env_default(*_DEFAULT_PORTS[plugin_type]))
 
         return plugin_config
 
@@ -285,7 +523,8 @@ class PluginRegistry:
 def load_plugins_for_agents(agents_config: list[dict[str, Any]]) -> dict[str, Any]:
     """
     Load plugins for all agents in the configuration.
-    Only loads plugins that are actually referenced in the configuration.
+    Only loads plugins that are actually referenced in the configuration;
+    plugin discovery does not run at all if no agent has a plugin_type.
 
     Args:
         agents_config: List of agent configuration dictionaries
@@ -296,27 +535,22 @@ def load_plugins_for_agents(agents_config: list[dict[str, Any]]) -> dict[str, An
     Raises:
         PluginLoadError: If any plugin fails to load
     """
-    # Discover available plugins first (this is fast and only happens once)
-    PluginRegistry.discover_plugins()
-    available = PluginRegistry.list_available_plugins()
-    logger.info(f"Available plugins: {', '.join(available) if available else 'none'}")
-    
     plugins = {}
     for agent_config in agents_config:
         agent_name = agent_config["name"]
         plugin_type = agent_config.get("plugin_type")
 
         if not plugin_type:
-            logger.info(f"Agent '{agent_name}' has no plugin_type, skipping plugin load")
+            logger.info("Agent '%s' has no plugin_type, skipping plugin load", agent_name)
             continue
 
         try:
             # Plugin class is loaded lazily only when needed
             plugin = PluginRegistry.create_plugin(plugin_type, agent_config)
             plugins[agent_name] = plugin
-            logger.info(f"Loaded {plugin_type} plugin for agent '{agent_name}'")
+            logger.info("Loaded %s plugin for agent '%s'", plugin_type, agent_name)
         except PluginLoadError as e:
-            logger.error(f"Failed to load plugin for agent '{agent_name}': {e}")
+            logger.error("Failed to load plugin for agent '%s': %s", agent_name, e)
             raise
 
     return plugins
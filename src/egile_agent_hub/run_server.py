@@ -10,13 +10,16 @@ This module orchestrates:
 from __future__ import annotations
 
 import asyncio
+import functools
+import importlib
+import inspect
 import logging
 import os
 import signal
-import subprocess
 import sys
 from pathlib import Path
-from typing import Any
+from collections.abc import Awaitable, Mapping
+from typing import Any, Callable, cast
 
 import uvicorn
 from agno.agent import Agent as AgnoAgent
@@ -25,10 +28,16 @@ from agno.os import AgentOS
 from agno.team import Team as AgnoTeam
 from dotenv import load_dotenv
 
-from egile_agent_core.models import Mistral, OpenAI, XAI
-from egile_agent_core.models.agno_adapter import AgnoModelAdapter
 from egile_agent_hub.config import ConfigError, get_default_model_config, load_config
-from egile_agent_hub.plugin_loader import PluginLoadError, load_plugins_for_agents
+from egile_agent_hub.plugin_loader import (
+    HAS_START,
+    HAS_TOOLS,
+    AgentStartHook,
+    PluginLoadError,
+    ToolProvider,
+    load_plugins_for_agents,
+    plugin_capabilities,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -40,15 +49,117 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Environment for MCP server subprocesses, built once after .env is loaded
+_MCP_SERVER_ENV = {"PYTHONIOENCODING": "utf-8", **os.environ}
+
 # Global process tracking
-mcp_processes: list[subprocess.Popen] = []
+mcp_processes: list[asyncio.subprocess.Process] = []
+
+# Event loop the MCP server processes were started on
+_mcp_loop: asyncio.AbstractEventLoop | None = None
+
+# Pending tasks waiting for MCP server processes to exit
+_exit_watchers: set[asyncio.Task] = set()
+
+# Backoff delays (seconds) between MCP server readiness probes, ~3 s in total
+_READY_PROBE_DELAYS = (0.02, 0.05, 0.1, 0.2, 0.4, 0.8, 1.6)
+
+# Per-connection SQLite settings: WAL lets agents read while another writes
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Shared databases keyed by file, so agents, teams and reruns use one pool
+_databases: dict[str, AsyncSqliteDb] = {}
+
+# Model provider name -> class name exported by egile_agent_core.models
+_PROVIDER_CLASS_NAMES = {
+    "mistral": "Mistral",
+    "xai": "XAI",
+    "openai": "OpenAI",
+}
+
+# Model classes resolved so far, keyed by provider name
+_PROVIDERS: dict[str, Callable[..., Any]] = {}
+
+
+class _AgentProxy:
+    """Minimal Agent-like object passed to plugin on_agent_start hooks."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+async def _wait_until_ready(
+    process: asyncio.subprocess.Process,
+    host: str,
+    port: int,
+) -> bool:
+    """
+    Wait until an MCP server accepts TCP connections, with exponential backoff.
+
+    Args:
+        process: MCP server subprocess
+        host: Host the server binds to
+        port: Port the server listens on
+
+    Returns:
+        True once the port accepts a connection, False if the process exits
+        or the port is still closed after the last probe
+    """
+    # Wildcard bind addresses are not connectable on every platform
+    probe_host = {"0.0.0.0": "127.0.0.1", "::": "::1", "": "127.0.0.1"}.get(host, host)
+
+    for delay in _READY_PROBE_DELAYS:
+        if process.returncode is not None:
+            return False
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(probe_host, port), timeout=delay
+            )
+        except (OSError, asyncio.TimeoutError):
+            await asyncio.sleep(delay)
+            continue
+
+        writer.close()
+        return True
+
+    return False
+
+
+def _watch_process_exit(process: asyncio.subprocess.Process, module_name: str) -> None:
+    """
+    Log and stop tracking an MCP server as soon as it exits unexpectedly.
+
+    Relies on asyncio's child watcher, so no polling is involved.
+
+    Args:
+        process: MCP server subprocess
+        module_name: MCP server module, for logging
+    """
+
+    async def _wait() -> None:
+        returncode = await process.wait()
+        # Processes stopped by cleanup_processes are no longer tracked
+        if process in mcp_processes:
+            mcp_processes.remove(process)
+            logger.warning("MCP server %s exited with code %s", module_name, returncode)
+
+    task = asyncio.get_running_loop().create_task(_wait())
+    _exit_watchers.add(task)
+    task.add_done_callback(_exit_watchers.discard)
 
 
 async def start_mcp_server(
     module_name: str,
     port: int,
     host: str = "0.0.0.0",
-) -> subprocess.Popen | None:
+) -> asyncio.subprocess.Process | None:
     """
     Start a single MCP server as a subprocess.
 
@@ -60,51 +171,64 @@ async def start_mcp_server(
     Returns:
         Subprocess instance or None if failed
     """
-    logger.info(f"Starting MCP server: {module_name} on {host}:{port}")
+    logger.info("Starting MCP server: %s on %s:%s", module_name, host, port)
 
-    env = os.environ.copy()
-    env.setdefault("PYTHONIOENCODING", "utf-8")
+    # Server output goes to the hub's terminal only when debugging; otherwise
+    # it is discarded so chatty servers don't contend for the shared tty
+    debug = os.getenv("AGENT_HUB_DEBUG") == "1"
+    output = None if debug else asyncio.subprocess.DEVNULL
 
     try:
-        # Start with inherited stdout/stderr so we can see MCP server logs
         # Use -u for unbuffered output
-        process = subprocess.Popen(
-            [
-                sys.executable,
-                "-u",  # Unbuffered output
-                "-m",
-                module_name,
-                "--transport",
-                "sse",
-                "--host",
-                host,
-                "--port",
-                str(port),
-            ],
-            stdout=None,  # Inherit stdout to see logs
-            stderr=None,  # Inherit stderr to see errors
-            text=True,
-            env=env,
-            bufsize=0,  # No buffering
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-u",  # Unbuffered output
+            "-m",
+            module_name,
+            "--transport",
+            "sse",
+            "--host",
+            host,
+            "--port",
+            str(port),
+            stdout=output,
+            stderr=output,
+            env=_MCP_SERVER_ENV,
         )
 
-        # Wait for startup
-        await asyncio.sleep(2)
+        # Track the server right away so it is cleaned up, and its exit
+        # reported, even while AgentOS is still being created
+        mcp_processes.append(process)
+
+        # Wait until the server accepts connections or exits
+        ready = await _wait_until_ready(process, host, port)
 
         # Check if process is still running
-        if process.poll() is not None:
-            logger.error(f"MCP server {module_name} failed to start (check output above)")
+        if process.returncode is not None:
+            if process in mcp_processes:
+                mcp_processes.remove(process)
+            logger.error(
+                "MCP server %s failed to start (%s)",
+                module_name,
+                "check output above" if debug else "set AGENT_HUB_DEBUG=1 to see its output",
+            )
             return None
 
-        logger.info(f"MCP server {module_name} started successfully on port {port}")
+        _watch_process_exit(process, module_name)
+
+        if not ready:
+            logger.warning("MCP server %s is running but not yet accepting connections", module_name)
+            return process
+
+        logger.info("MCP server %s started successfully on port %s", module_name, port)
         return process
 
     except Exception as e:
-        logger.error(f"Failed to start MCP server {module_name}: {e}")
+        logger.error("Failed to start MCP server %s: %s", module_name, e)
         return None
 
 
-async def start_all_mcp_servers(hub_config) -> list[subprocess.Popen]:
+async def start_all_mcp_servers(hub_config) -> list[asyncio.subprocess.Process]:
     """
     Start all MCP servers required by the agent configuration (SSE transport only).
     
@@ -123,51 +247,111 @@ async def start_all_mcp_servers(hub_config) -> list[subprocess.Popen]:
         logger.info("No MCP servers to start (no agents with plugins)")
         return processes
     
-    # Filter for SSE transport only - stdio servers are spawned by clients
-    sse_servers = {
-        name: config for name, config in mcp_servers.items()
-        if config.get("transport", "sse") == "sse"
-    }
-    
-    if not sse_servers:
-        logger.info("No SSE MCP servers to pre-start (using stdio transport)")
-        return processes
-
-    logger.info(f"Starting {len(sse_servers)} SSE MCP server(s)...")
-
     # Import PluginRegistry to auto-discover MCP server modules
     from egile_agent_hub.plugin_loader import PluginRegistry
 
-    # Start each unique MCP server
-    started_ports = set()
-    for agent_name, server_config in sse_servers.items():
+    # Single pass: keep SSE servers only (stdio servers are spawned by clients),
+    # one per unique port, with their MCP server module resolved
+    plan: list[tuple[str, int, str]] = []
+    seen_ports = set()
+    has_sse = False
+    for agent_name, server_config in mcp_servers.items():
+        if server_config.get("transport", "sse") != "sse":
+            continue
+        has_sse = True
+
         plugin_type = server_config["plugin_type"]
         port = server_config["port"]
-        host = server_config["host"]
 
-        # Skip if already started on this port
-        if port in started_ports:
-            logger.info(f"MCP server for {agent_name} already started on port {port}")
+        # Skip if already scheduled on this port
+        if port in seen_ports:
+            logger.info(
+                "Agent %s shares port %s with an MCP server already scheduled to start",
+                agent_name,
+                port,
+            )
             continue
 
         # Auto-discover MCP server module from plugin
         module_name = PluginRegistry.get_mcp_server_module(plugin_type)
         if not module_name:
             logger.warning(
-                f"Plugin '{plugin_type}' for agent '{agent_name}' does not provide an MCP server module. "
-                f"Make sure the plugin class has a 'mcp_server_module' property."
+                "Plugin '%s' for agent '%s' does not provide an MCP server module. "
+                "Make sure the plugin class has a 'mcp_server_module' property.",
+                plugin_type,
+                agent_name,
             )
             continue
 
-        process = await start_mcp_server(module_name, port, host)
-        if process:
-            processes.append(process)
-            started_ports.add(port)
+        seen_ports.add(port)
+        plan.append((module_name, port, server_config["host"]))
+
+    if not has_sse:
+        logger.info("No SSE MCP servers to pre-start (using stdio transport)")
+        return processes
+
+    logger.info("Starting %s SSE MCP server(s)...", len(plan))
 
-    logger.info(f"Successfully started {len(processes)} MCP server(s)")
+    # Start all servers concurrently so their startup waits overlap
+    results = await asyncio.gather(
+        *(start_mcp_server(module_name, port, host) for module_name, port, host in plan),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.error("Failed to start MCP server: %s", result)
+        elif result:
+            processes.append(result)
+
+    logger.info("Successfully started %s MCP server(s)", len(processes))
     return processes
 
 
+def _get_provider(provider: str) -> Callable[..., Any]:
+    """
+    Get the model class for a provider, importing it on first use.
+
+    Args:
+        provider: Model provider name (e.g., "mistral")
+
+    Returns:
+        Model class from egile_agent_core.models
+
+    Raises:
+        ValueError: If the provider is unknown
+    """
+    factory = _PROVIDERS.get(provider)
+    if factory is None:
+        class_name = _PROVIDER_CLASS_NAMES.get(provider)
+        if class_name is None:
+            raise ValueError(f"Unknown model provider: {provider}")
+        models = importlib.import_module("egile_agent_core.models")
+        factory = _PROVIDERS[provider] = getattr(models, class_name)
+    return factory
+
+
+@functools.lru_cache(maxsize=1)
+def _get_adapter() -> tuple[Callable[..., Any], bool]:
+    """
+    Import AgnoModelAdapter on first use and probe whether it accepts tools.
+
+    Importing egile_agent_core.models.agno_adapter also imports every model
+    provider, so this is deferred like _get_provider.
+
+    Returns:
+        Tuple of (AgnoModelAdapter class, whether it accepts a tools argument)
+    """
+    from egile_agent_core.models.agno_adapter import AgnoModelAdapter
+
+    # Older egile-agent-core adapters do not accept a tools argument; an
+    # adapter taking **kwargs is assumed to accept it
+    parameters = inspect.signature(AgnoModelAdapter).parameters
+    supports_tools = "tools" in parameters or any(
+        p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()
+    )
+    return AgnoModelAdapter, supports_tools
+
+
 def create_model_instance(model_config: dict[str, str]):
     """
     Create a model instance from configuration.
@@ -178,26 +362,143 @@ def create_model_instance(model_config: dict[str, str]):
     Returns:
         BaseLLM instance
     """
-    provider = model_config["provider"]
-    model_name = model_config["model"]
+    return _get_provider(model_config["provider"])(model=model_config["model"])
+
+
+def _configure_sqlite(db: AsyncSqliteDb) -> None:
+    """
+    Apply _SQLITE_PRAGMAS to every connection the database opens.
+
+    Args:
+        db: Database whose SQLAlchemy engine should be configured
+    """
+    sync_engine = getattr(getattr(db, "db_engine", None), "sync_engine", None)
+    if sync_engine is None:
+        logger.debug("Database engine not exposed, keeping default SQLite settings")
+        return
+
+    from sqlalchemy import event
+
+    @event.listens_for(sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in _SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def _get_database(db_file: str) -> AsyncSqliteDb:
+    """
+    Get the shared database for a file, creating and configuring it once.
+
+    Args:
+        db_file: SQLite database file
+
+    Returns:
+        AsyncSqliteDb instance
+    """
+    db = _databases.get(db_file)
+    if db is None:
+        db = _databases[db_file] = AsyncSqliteDb(db_file=db_file)
+        _configure_sqlite(db)
+    return db
+
+
+def _get_shared_model(
+    model_cache: dict[tuple[str, str], Any],
+    model_config: dict[str, str],
+):
+    """
+    Get a model instance for a configuration, creating one per provider and model.
+
+    Agents and teams using the same provider and model share the instance
+    (and its HTTP client); each still gets its own AgnoModelAdapter.
+
+    Args:
+        model_cache: Models created so far, keyed by (provider, model)
+        model_config: Dictionary with 'provider' and 'model' keys
+
+    Returns:
+        BaseLLM instance
+    """
+    key = (model_config["provider"], model_config["model"])
+    model = model_cache.get(key)
+    if model is None:
+        model = model_cache[key] = create_model_instance(model_config)
+    return model
+
+
+def _build_agent(
+    agent_config: dict[str, Any],
+    model: Any,
+    tools: list[Any],
+    db: AsyncSqliteDb,
+) -> AgnoAgent:
+    """
+    Create an Agno agent with memory enabled from its configuration.
 
-    if provider == "mistral":
-        return Mistral(model=model_name)
-    elif provider == "xai":
-        return XAI(model=model_name)
-    elif provider == "openai":
-        return OpenAI(model=model_name)
+    Args:
+        agent_config: Agent configuration dictionary
+        model: BaseLLM instance for the agent
+        tools: Tool functions provided by the agent's plugin
+        db: Shared database for agent memory
+
+    Returns:
+        AgnoAgent instance
+    """
+    agent_name = agent_config["name"]
+
+    # Create adapter with tools
+    # Tools must be registered with the adapter so it can execute them
+    adapter_class, supports_tools = _get_adapter()
+    if supports_tools:
+        agno_model = adapter_class(model, tools=tools if tools else None)
+        logger.info("Successfully created AgnoModelAdapter with %s tools", len(tools))
     else:
-        raise ValueError(f"Unknown model provider: {provider}")
+        agno_model = adapter_class(model)
+        if tools:
+            logger.warning(
+                "AgnoModelAdapter does not accept tools; %s tool(s) for '%s' "
+                "are not registered with the adapter",
+                len(tools),
+                agent_name,
+            )
+
+    # Create Agno agent with memory enabled
+    agent = AgnoAgent(
+        name=agent_name,
+        model=agno_model,
+        db=db,
+        instructions=agent_config.get("instructions", []),
+        description=agent_config.get("description", ""),
+        tools=tools if tools else None,
+        markdown=agent_config.get("markdown", True),
+        debug_mode=agent_config.get("debug_mode", False),
+        add_history_to_context=True,    # Load conversation history from database
+        num_history_messages=20,        # Include last 20 messages in context
+        max_tool_calls_from_history=0,  # Don't replay tool calls from history
+        read_tool_call_history=False,   # Don't read tool calls from history at all
+        tool_call_limit=agent_config.get("tool_call_limit"),  # Optional limit on tool calls per turn
+    )
+    logger.info("  Created agent '%s' with memory enabled (history: 20 messages)", agent_name)
+    return agent
 
 
-async def create_multi_agent_os(hub_config, plugins: dict[str, Any]) -> AgentOS:
+async def create_multi_agent_os(
+    hub_config,
+    plugins: Mapping[str, Any],
+    mcp_ready: Awaitable[Any] | None = None,
+) -> AgentOS:
     """
     Create a unified AgentOS with all configured agents and teams.
 
     Args:
         hub_config: AgentHubConfig instance
-        plugins: Dictionary mapping agent name to plugin instance
+        plugins: Mapping from agent name to plugin instance
+        mcp_ready: Optional awaitable that completes once MCP servers are up;
+            awaited before plugins are initialized
 
     Returns:
         Configured AgentOS instance
@@ -206,18 +507,23 @@ async def create_multi_agent_os(hub_config, plugins: dict[str, Any]) -> AgentOS:
 
     # Get default model configuration
     default_model_config = get_default_model_config()
-    logger.info(f"Default model: {default_model_config['provider']} - {default_model_config['model']}")
+    logger.info("Default model: %s - %s", default_model_config["provider"], default_model_config["model"])
 
     # Create shared database
     db_file = os.getenv("DB_FILE", "agent_hub.db")
-    db = AsyncSqliteDb(db_file=db_file)
-    logger.info(f"Using database: {db_file}")
+    db = _get_database(db_file)
+    logger.info("Using database: %s", db_file)
 
-    # Create agents
-    agno_agents = {}
+    default_provider = default_model_config["provider"]
+    model_cache: dict[tuple[str, str], Any] = {}
+
+    # Resolve models and plugin tools here, since the model cache is not
+    # thread-safe; only the agents themselves are built in threads
+    build_args: list[tuple[dict[str, Any], Any, list[Any]]] = []
+    start_hooks: dict[str, AgentStartHook] = {}
     for agent_config in hub_config.agents:
         agent_name = agent_config["name"]
-        logger.info(f"Creating agent: {agent_name}")
+        logger.info("Creating agent: %s", agent_name)
 
         # Determine model for this agent
         if "model_override" in agent_config:
@@ -225,81 +531,89 @@ async def create_multi_agent_os(hub_config, plugins: dict[str, Any]) -> AgentOS:
             if isinstance(model_config, str):
                 # Simple model name override
                 model_config = {
-                    "provider": default_model_config["provider"],
+                    "provider": default_provider,
                     "model": model_config,
                 }
         else:
             model_config = default_model_config
 
-        model = create_model_instance(model_config)
+        model = _get_shared_model(model_cache, model_config)
 
         # Get plugin if configured
         plugin = plugins.get(agent_name)
         tools = []
         if plugin:
-            if hasattr(plugin, "get_tool_functions"):
-                tool_functions = plugin.get_tool_functions()
+            caps = plugin_capabilities(plugin)
+            if caps & HAS_TOOLS:
+                tool_functions = cast(ToolProvider, plugin).get_tool_functions()
                 tools = list(tool_functions.values())
-                logger.info(f"  Registered {len(tools)} tool(s) for '{agent_name}'")
-
-        # Create adapter with tools
-        # Tools must be registered with the adapter so it can execute them
-        agno_model = AgnoModelAdapter(model, tools=tools if tools else None)
-        logger.info(f"Successfully created AgnoModelAdapter with {len(tools) if tools else 0} tools")
-
-        # Create Agno agent with memory enabled
-        agent = AgnoAgent(
-            name=agent_name,
-            model=agno_model,
-            db=db,
-            instructions=agent_config.get("instructions", []),
-            description=agent_config.get("description", ""),
-            tools=tools if tools else None,
-            markdown=agent_config.get("markdown", True),
-            debug_mode=agent_config.get("debug_mode", False),
-            add_history_to_context=True,    # Load conversation history from database
-            num_history_messages=20,        # Include last 20 messages in context
-            max_tool_calls_from_history=0,  # Don't replay tool calls from history
-            read_tool_call_history=False,   # Don't read tool calls from history at all
-            tool_call_limit=agent_config.get("tool_call_limit"),  # Optional limit on tool calls per turn
+                logger.info("  Registered %s tool(s) for '%s'", len(tools), agent_name)
+            if caps & HAS_START:
+                start_hooks[agent_name] = cast(AgentStartHook, plugin)
+
+        build_args.append((agent_config, model, tools))
+
+    # Import the adapter once here rather than racing the first import (and
+    # the cached signature probe) across the worker threads
+    _get_adapter()
+
+    # Agent construction is independent per agent, so run it off the event loop
+    agents = await asyncio.gather(
+        *(
+            asyncio.to_thread(_build_agent, agent_config, model, tools, db)
+            for agent_config, model, tools in build_args
         )
-        agno_agents[agent_name] = agent
-        logger.info(f"  Created agent '{agent_name}' with memory enabled (history: 20 messages)")
+    )
+    agno_agents = {
+        agent_config["name"]: agent
+        for (agent_config, _, _), agent in zip(build_args, agents)
+    }
     
+    # Plugins may connect to the MCP servers, so wait until those are up
+    if mcp_ready is not None:
+        await mcp_ready
+
     # Initialize all plugins by calling on_agent_start
     # This is critical for plugins that need to connect to MCP servers
     # Normally Agno would call this, but for team members it doesn't happen
     logger.info("Initializing agent plugins...")
-    for agent_name, agent in agno_agents.items():
-        plugin = plugins.get(agent_name)
-        if plugin and hasattr(plugin, 'on_agent_start'):
-            try:
-                # Create a dummy Agent-like object with the name for the plugin
-                class AgentProxy:
-                    def __init__(self, name):
-                        self.name = name
-                
-                await plugin.on_agent_start(AgentProxy(agent_name))
-                logger.info(f"  Initialized plugin for '{agent_name}'")
-            except Exception as e:
-                logger.error(f"  Failed to initialize plugin for '{agent_name}': {e}")
-                raise
+
+    # Plugins are independent, so start them concurrently
+    init_names = []
+    init_coros = []
+    for agent_name, plugin in start_hooks.items():
+        init_names.append(agent_name)
+        init_coros.append(plugin.on_agent_start(_AgentProxy(agent_name)))
+
+    results = await asyncio.gather(*init_coros, return_exceptions=True)
+    first_error = None
+    for agent_name, result in zip(init_names, results):
+        if isinstance(result, BaseException):
+            logger.error("  Failed to initialize plugin for '%s': %s", agent_name, result)
+            first_error = first_error or result
+        else:
+            logger.info("  Initialized plugin for '%s'", agent_name)
+    if first_error is not None:
+        raise first_error
 
     # Create teams (if configured)
     agno_teams = []
     if hub_config.teams:
-        logger.info(f"Creating {len(hub_config.teams)} team(s)...")
+        logger.info("Creating %s team(s)...", len(hub_config.teams))
         
         for team_config in hub_config.teams:
             team_name = team_config["name"]
-            logger.info(f"Creating team: {team_name}")
+            logger.info("Creating team: %s", team_name)
 
             # Get team members
             member_names = team_config["members"]
-            members = [agno_agents[name] for name in member_names if name in agno_agents]
-            
+            members = [a for a in (agno_agents.get(n) for n in member_names) if a is not None]
+            if len(members) != len(member_names):
+                missing = set(member_names) - agno_agents.keys()
+                logger.warning("Team '%s' skips unknown member(s): %s", team_name, ", ".join(sorted(missing)))
+
             if not members:
-                logger.warning(f"Team '{team_name}' has no valid members, skipping")
+                logger.warning("Team '%s' has no valid members, skipping", team_name)
                 continue
 
             # Determine team leader model
@@ -307,19 +621,16 @@ async def create_multi_agent_os(hub_config, plugins: dict[str, Any]) -> AgentOS:
                 model_config = team_config["model_override"]
                 if isinstance(model_config, str):
                     model_config = {
-                        "provider": default_model_config["provider"],
+                        "provider": default_provider,
                         "model": model_config,
                     }
-                team_model = create_model_instance(model_config)
+                team_model = _get_shared_model(model_cache, model_config)
             else:
-                team_model = create_model_instance(default_model_config)
+                team_model = _get_shared_model(model_cache, default_model_config)
 
             # Wrap team model in AgnoModelAdapter (teams also need wrapped models)
-            try:
-                team_agno_model = AgnoModelAdapter(team_model)
-            except TypeError:
-                logger.warning(f"AgnoModelAdapter doesn't support tools parameter - using older version")
-                team_agno_model = AgnoModelAdapter(team_model)
+            adapter_class, _ = _get_adapter()
+            team_agno_model = adapter_class(team_model)
 
             # Create Agno team with memory enabled and proper collaboration mode
             team = AgnoTeam(
@@ -343,17 +654,17 @@ async def create_multi_agent_os(hub_config, plugins: dict[str, Any]) -> AgentOS:
                 num_team_history_runs=3,               # Include last 3 team runs in member context
             )
             agno_teams.append(team)
-            logger.info(f"  Created team '{team_name}' with {len(members)} member(s) and memory enabled (history: 20 messages)")
+            logger.info("  Created team '%s' with %s member(s) and memory enabled (history: 20 messages)", team_name, len(members))
 
     # AgentOS requires Agent instances in agents parameter
     # And Team instances in teams parameter (separate!)
     os_agents = list(agno_agents.values())
     
     if agno_teams:
-        logger.info(f"Created {len(agno_teams)} team(s) with {len(os_agents)} total agent(s)")
-        logger.info(f"AgentOS will expose {len(os_agents)} agent(s) and {len(agno_teams)} team(s)")
+        logger.info("Created %s team(s) with %s total agent(s)", len(agno_teams), len(os_agents))
+        logger.info("AgentOS will expose %s agent(s) and %s team(s)", len(os_agents), len(agno_teams))
     else:
-        logger.info(f"AgentOS will expose {len(os_agents)} individual agent(s)")
+        logger.info("AgentOS will expose %s individual agent(s)", len(os_agents))
 
     # Create AgentOS with both agents and teams
     agent_os = AgentOS(
@@ -367,8 +678,80 @@ async def create_multi_agent_os(hub_config, plugins: dict[str, Any]) -> AgentOS:
     return agent_os
 
 
-def print_startup_info():
-    """Print startup information and instructions."""
+async def _bootstrap(hub_config, plugins: Mapping[str, Any]) -> AgentOS:
+    """
+    Start MCP servers and create AgentOS on a single event loop.
+
+    MCP server startup runs as a background task while agents are created;
+    plugin initialization waits for it to finish.
+
+    Args:
+        hub_config: AgentHubConfig instance
+        plugins: Mapping from agent name to plugin instance
+
+    Returns:
+        Configured AgentOS instance
+    """
+    mcp_task = asyncio.create_task(start_all_mcp_servers(hub_config))
+    try:
+        agent_os = await create_multi_agent_os(hub_config, plugins, mcp_ready=mcp_task)
+    finally:
+        # Let startup finish even if AgentOS creation failed; the servers are
+        # tracked in mcp_processes as they start, so they get cleaned up
+        await mcp_task
+    return agent_os
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create the event loop used for bootstrap and serving.
+
+    Uses uvloop when it is installed (uvicorn[standard] pulls it in on
+    non-Windows platforms), otherwise the default asyncio loop.
+
+    Returns:
+        New event loop
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+
+    logger.info("Using uvloop event loop")
+    return uvloop.new_event_loop()
+
+
+def _serve_app(loop: asyncio.AbstractEventLoop, app: Any) -> None:
+    """
+    Serve the AgentOS app with Uvicorn on an existing event loop.
+
+    Reusing the bootstrap loop keeps resources created during startup
+    (plugin MCP sessions, database connections, exit watchers) alive.
+
+    Args:
+        loop: Event loop used to create AgentOS
+        app: ASGI application from AgentOS
+    """
+    agentos_port = int(os.getenv("AGENTOS_PORT", "8000"))
+    agentos_host = os.getenv("AGENTOS_HOST", "0.0.0.0")
+
+    config = uvicorn.Config(
+        app,
+        host=agentos_host,
+        port=agentos_port,
+        loop="none",  # The loop is created by _new_event_loop()
+        lifespan="on",
+    )
+    loop.run_until_complete(uvicorn.Server(config).serve())
+
+
+def print_startup_info(hub_config):
+    """
+    Print startup information and instructions.
+
+    Args:
+        hub_config: AgentHubConfig instance the hub was started with
+    """
     print("\n" + "=" * 70)
     print("🚀 EGILE AGENT HUB - Multi-Agent System")
     print("=" * 70)
@@ -376,8 +759,7 @@ def print_startup_info():
     print(f"  • AgentOS API:     http://localhost:{os.getenv('AGENTOS_PORT', '8000')}")
     
     # Print MCP servers
-    config = load_config()
-    mcp_servers = config.get_mcp_servers()
+    mcp_servers = hub_config.get_mcp_servers()
     if mcp_servers:
         print("\n  • MCP Servers:")
         for agent_name, server_config in mcp_servers.items():
@@ -400,23 +782,65 @@ def print_startup_info():
     print("=" * 70 + "\n")
 
 
+async def _stop_processes(processes: list[asyncio.subprocess.Process]) -> None:
+    """
+    Terminate MCP server processes and wait for them to exit.
+
+    Args:
+        processes: MCP server subprocesses to stop
+    """
+    for process in processes:
+        try:
+            process.terminate()
+        except ProcessLookupError:
+            pass
+
+    for process in processes:
+        try:
+            await asyncio.wait_for(process.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            logger.warning("MCP server (pid %s) did not exit within 5 s, killing it", process.pid)
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            await process.wait()
+        except Exception as e:
+            logger.error("Error stopping MCP server (pid %s): %s", process.pid, e)
+
+
 def cleanup_processes():
-    """Terminate all MCP server processes."""
+    """Terminate all MCP server processes, killing any that do not exit in time."""
     global mcp_processes
-    if mcp_processes:
-        logger.info("Shutting down MCP servers...")
+    if not mcp_processes:
+        return
+
+    loop = _mcp_loop
+    if loop is not None and loop.is_running():
+        # Called from inside the running loop, which is where signal handlers
+        # run once Uvicorn re-raises the shutdown signal. Ask the servers to
+        # exit now but keep tracking them: after sys.exit unwinds the loop,
+        # the call from run_all's finally block waits for them and kills any
+        # that are still alive.
         for process in mcp_processes:
             try:
                 process.terminate()
-                process.wait(timeout=5)
-            except Exception as e:
-                logger.error(f"Error terminating process: {e}")
-                try:
-                    process.kill()
-                except:
-                    pass
-        mcp_processes = []
-        logger.info("All MCP servers stopped")
+            except ProcessLookupError:
+                pass
+        return
+
+    logger.info("Shutting down MCP servers...")
+    processes, mcp_processes = mcp_processes, []
+    if loop is not None and not loop.is_closed():
+        loop.run_until_complete(_stop_processes(processes))
+    else:
+        # Without their loop the processes can only be signalled
+        for process in processes:
+            try:
+                process.terminate()
+            except ProcessLookupError:
+                pass
+    logger.info("All MCP servers stopped")
 
 
 def signal_handler(signum, frame):
@@ -428,7 +852,7 @@ def signal_handler(signum, frame):
 
 def run_all():
     """Run all services: MCP servers + AgentOS."""
-    global mcp_processes
+    global _mcp_loop
     
     # Register signal handlers
     signal.signal(signal.SIGINT, signal_handler)
@@ -443,32 +867,26 @@ def run_all():
         logger.info("Loading agent plugins...")
         plugins = load_plugins_for_agents(hub_config.agents)
 
-        # Start MCP servers (async)
-        loop = asyncio.new_event_loop()
+        # Start MCP servers and create AgentOS (async - needs plugin initialization)
+        loop = _mcp_loop = _new_event_loop()
         asyncio.set_event_loop(loop)
-        mcp_processes = loop.run_until_complete(start_all_mcp_servers(hub_config))
-
-        # Create AgentOS (async - needs plugin initialization)
-        agent_os = loop.run_until_complete(create_multi_agent_os(hub_config, plugins))
+        agent_os = loop.run_until_complete(_bootstrap(hub_config, plugins))
         app = agent_os.get_app()
 
         # Print startup info
-        print_startup_info()
+        print_startup_info(hub_config)
 
-        # Run AgentOS
-        agentos_port = int(os.getenv("AGENTOS_PORT", "8000"))
-        agentos_host = os.getenv("AGENTOS_HOST", "0.0.0.0")
-        
-        uvicorn.run(app, host=agentos_host, port=agentos_port)
+        # Run AgentOS on the same loop
+        _serve_app(loop, app)
 
     except (ConfigError, PluginLoadError) as e:
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         cleanup_processes()
         sys.exit(1)
     except KeyboardInterrupt:
         logger.info("Shutting down...")
     except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
+        logger.exception("Unexpected error: %s", e)
         cleanup_processes()
         sys.exit(1)
     finally:
@@ -487,7 +905,7 @@ def run_agentos_only():
         plugins = load_plugins_for_agents(hub_config.agents)
 
         # Create AgentOS (async - needs plugin initialization)
-        loop = asyncio.new_event_loop()
+        loop = _new_event_loop()
         asyncio.set_event_loop(loop)
         agent_os = loop.run_until_complete(create_multi_agent_os(hub_config, plugins))
         app = agent_os.get_app()
@@ -500,19 +918,16 @@ def run_agentos_only():
         print(f"\n📡 AgentOS API: http://localhost:{os.getenv('AGENTOS_PORT', '8000')}")
         print("=" * 70 + "\n")
 
-        # Run AgentOS
-        agentos_port = int(os.getenv("AGENTOS_PORT", "8000"))
-        agentos_host = os.getenv("AGENTOS_HOST", "0.0.0.0")
-        
-        uvicorn.run(app, host=agentos_host, port=agentos_port)
+        # Run AgentOS on the same loop
+        _serve_app(loop, app)
 
     except (ConfigError, PluginLoadError) as e:
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         sys.exit(1)
     except KeyboardInterrupt:
         logger.info("Shutting down...")
     except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
+        logger.exception("Unexpected error: %s", e)
         sys.exit(1)
 
 